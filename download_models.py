@@ -6,12 +6,23 @@ Downloads the required TTS models for GLaDOS and Kokoro voices.
 Uses the exact same URLs and checksums as the original GLaDOS repository.
 """
 
+import argparse
 import os
+import shutil
 import sys
+import threading
+import urllib.error
 import urllib.request
 import hashlib
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+try:
+    import urllib3
+except ImportError:  # The script also runs on a bare interpreter before `pip install`
+    urllib3 = None
+
 # Model URLs from original GLaDOS GitHub releases
 MODELS = {
     "glados.onnx": {
@@ -36,42 +47,256 @@ MODELS = {
     }
 }
 
+# Optional int8 copy of the GLaDOS model, loaded by the synthesizer when GLADOS_QUANTIZE=1
+QUANTIZED_MODELS = {"glados.onnx": "glados.int8.onnx"}
+
+# Only MatMul weights are quantized: ONNX Runtime's CPU ConvInteger kernel is far slower
+# than a float Conv, and the VITS graph is mostly convolutions
+QUANTIZED_OP_TYPES = ["MatMul"]
+
+# The Kokoro voices archive is an .npz; each voice is unpacked into VOICES_DIR as its own
+# .npy so the server can memory-map it instead of reading it out of the archive
+VOICES_ARCHIVE = "kokoro-voices-v1.0.bin"
+VOICES_DIR = "voices"
+
+# Read size for streaming downloads
+CHUNK_SIZE = 1 << 17
+
+# Attempts per file; each retry resumes from the bytes already on disk
+MAX_ATTEMPTS = 3
+
+# Seconds a read may stall before it fails, so a hung connection gets retried and resumed
+# instead of blocking forever
+READ_TIMEOUT = 60
+
+# Shared connection pool so the downloads reuse TLS connections to the release host
+_http = (
+    urllib3.PoolManager(
+        num_pools=4,
+        maxsize=4,
+        retries=urllib3.Retry(total=5, backoff_factor=0.5),
+        timeout=urllib3.Timeout(connect=10, read=READ_TIMEOUT),
+    )
+    if urllib3 is not None
+    else None
+)
+
+# Set on Ctrl-C so the worker threads stop at their next chunk, keeping their .part files
+_cancelled = threading.Event()
+
+# Per-file download progress, shared by the worker threads in main()
+_progress: dict[str, int] = {}
+_progress_lock = threading.Lock()
+_progress_drawn = False
+
+def _report_progress(description: str, percent: int):
+    """Redraw a single progress line covering every in-flight download."""
+    global _progress_drawn
+    with _progress_lock:
+        if _progress.get(description) == percent:
+            return
+        _progress[description] = percent
+        line = "  ".join(f"{name.split()[0]}: {pct}%" for name, pct in _progress.items())
+        sys.stdout.write(f"\r  Progress: {line}")
+        sys.stdout.flush()
+        _progress_drawn = True
+
+def _log(message: str):
+    """Print a full line without tearing the shared progress line."""
+    global _progress_drawn
+    with _progress_lock:
+        print(f"\n{message}" if _progress_drawn else message)
+        _progress_drawn = False
+
+def _open_url(url: str, headers: dict[str, str] | None = None):
+    """Open a streaming response for url, through the shared pool when urllib3 is available.
+
+    A 416 (range not satisfiable) response is returned rather than raised so
+    callers can discard a stale partial download.
+    """
+    if _http is None:
+        try:
+            return urllib.request.urlopen(urllib.request.Request(url, headers=headers or {}), timeout=READ_TIMEOUT)
+        except urllib.error.HTTPError as e:
+            if e.code != 416:
+                raise
+            return e
+    response = _http.request("GET", url, headers=headers, preload_content=False)
+    if response.status >= 400 and response.status != 416:
+        response.release_conn()
+        raise urllib3.exceptions.HTTPError(f"HTTP {response.status} for {url}")
+    return response
+
+def _release(response):
+    """Hand a response's connection back to the pool, or close it."""
+    getattr(response, "release_conn", response.close)()
+
+def _sha256(filepath: Path):
+    """Return a SHA256 hash object fed with the contents of filepath."""
+    with open(filepath, "rb", buffering=0) as f:
+        if sys.version_info >= (3, 11):
+            # Hashes in C and releases the GIL, so parallel verifications overlap
+            return hashlib.file_digest(f, "sha256")
+        sha256_hash = hashlib.sha256()
+        buffer = memoryview(bytearray(CHUNK_SIZE))
+        while n := f.readinto(buffer):
+            sha256_hash.update(buffer[:n])
+    return sha256_hash
+
 def verify_checksum(filepath: Path, expected_checksum: str) -> bool:
     """Verify SHA256 checksum of downloaded file."""
-    sha256_hash = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(chunk)
-    return sha256_hash.hexdigest() == expected_checksum
+    return _sha256(filepath).hexdigest() == expected_checksum
+
+def _verified_marker(filepath: Path) -> Path:
+    """Sidecar file recording that filepath passed checksum verification."""
+    return filepath.with_name(filepath.name + ".ok")
+
+def _mark_verified(filepath: Path, expected_checksum: str):
+    """Record filepath's size and mtime so unchanged files can skip re-hashing."""
+    stat = filepath.stat()
+    _verified_marker(filepath).write_text(f"{stat.st_size} {stat.st_mtime_ns} {expected_checksum}\n")
+
+def _is_marked_verified(filepath: Path, expected_checksum: str) -> bool:
+    """Check whether filepath was verified before and hasn't changed since."""
+    try:
+        size, mtime_ns, checksum = _verified_marker(filepath).read_text().split()
+        stat = filepath.stat()
+    except (OSError, ValueError):
+        return False
+    return (int(size), int(mtime_ns), checksum) == (stat.st_size, stat.st_mtime_ns, expected_checksum)
+
+def _fetch(url: str, partial: Path, description: str):
+    """Download url into partial, resuming from its current size.
+
+    Returns the SHA256 of the partial file and whether it was built on bytes left by an
+    earlier attempt; if so, a checksum mismatch may be the old prefix's fault.
+    """
+    offset = partial.stat().st_size if partial.exists() else 0
+    response = _open_url(url, {"Range": f"bytes={offset}-"} if offset else None)
+    try:
+        if response.status == 416:
+            # Nothing past offset: the partial is either already complete or doesn't match
+            # the remote file, and the checksum tells which
+            return _sha256(partial), True
+        if response.status == 206:
+            # Server honoured the range: hash the prefix we already have, then append
+            sha256_hash = _sha256(partial)
+            mode = "ab"
+        else:
+            sha256_hash = hashlib.sha256()
+            mode = "wb"
+            offset = 0
+        total_size = offset + int(response.headers.get("Content-Length") or 0)
+        downloaded = offset
+        with open(partial, mode) as f:
+            while chunk := response.read(CHUNK_SIZE):
+                if _cancelled.is_set():
+                    raise InterruptedError("download cancelled")
+                f.write(chunk)
+                # Hash while streaming so the file never has to be read back from disk
+                sha256_hash.update(chunk)
+                downloaded += len(chunk)
+                if total_size > 0:
+                    _report_progress(description, min(100, downloaded * 100 // total_size))
+    finally:
+        _release(response)
+    return sha256_hash, offset > 0
 
 def download_file(url: str, filepath: Path, description: str, expected_checksum: str):
-    """Download a file with progress indication and checksum verification."""
-    print(f"Downloading {description}...")
-    
-    def progress_hook(block_num, block_size, total_size):
-        if total_size > 0:
-            percent = min(100, (block_num * block_size * 100) // total_size)
-            sys.stdout.write(f"\r  Progress: {percent}% ({block_num * block_size // 1024 // 1024}MB)")
-            sys.stdout.flush()
+    """Download a file with progress indication and checksum verification.
+
+    Data is streamed into a ``.part`` file next to filepath. If a transfer is
+    interrupted the partial file is kept, and later attempts (including later
+    runs of this script) resume it with an HTTP Range request.
+    """
+    _log(f"Downloading {description}...")
+    partial = filepath.with_name(filepath.name + ".part")
     
-    try:
-        urllib.request.urlretrieve(url, filepath, progress_hook)
-        print(f"\n  Verifying checksum...")
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            sha256_hash, resumed = _fetch(url, partial, description)
+        except Exception as e:
+            if _cancelled.is_set():
+                return False
+            if attempt == MAX_ATTEMPTS:
+                _log(f"  ❌ Failed to download {description}: {e}")
+                return False
+            _log(f"  ⚠️  {description} interrupted ({e}), resuming...")
+            continue
         
-        if verify_checksum(filepath, expected_checksum):
-            print(f"  ✅ Downloaded and verified {description}")
+        if sha256_hash.hexdigest() == expected_checksum:
+            partial.replace(filepath)
+            _mark_verified(filepath, expected_checksum)
+            _log(f"  ✅ Downloaded and verified {description}")
             return True
-        else:
-            print(f"  ❌ Checksum verification failed for {description}")
-            filepath.unlink()  # Delete corrupted file
-            return False
-            
-    except Exception as e:
-        print(f"\n  ❌ Failed to download {description}: {e}")
+        
+        partial.unlink()  # Delete corrupted file
+        if resumed and attempt < MAX_ATTEMPTS:
+            # The bytes kept from an earlier attempt may be what's bad; fetch it all afresh
+            _log(f"  ⚠️  {description} failed verification after resuming, restarting from scratch...")
+            continue
+        _log(f"  ❌ Checksum verification failed for {description}")
         return False
 
+def quantize_models(models_dir: Path) -> bool:
+    """Write int8 dynamically quantized copies of the models in QUANTIZED_MODELS."""
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError:
+        print("  ⚠️  Quantization needs onnxruntime and onnx; run this from the server's venv")
+        return False
+    
+    for source_name, target_name in QUANTIZED_MODELS.items():
+        source, target = models_dir / source_name, models_dir / target_name
+        if target.exists() and target.stat().st_mtime >= source.stat().st_mtime:
+            print(f"⏭️  {target_name} is up to date, skipping quantization")
+            continue
+        print(f"🔧 Quantizing {source_name} to int8...")
+        try:
+            quantize_dynamic(
+                str(source), str(target), op_types_to_quantize=QUANTIZED_OP_TYPES, weight_type=QuantType.QInt8
+            )
+        except Exception as e:
+            print(f"  ❌ Failed to quantize {source_name}: {e}")
+            target.unlink(missing_ok=True)
+            return False
+        print(f"  ✅ Wrote {target_name}")
+    return True
+
+def extract_voices(models_dir: Path):
+    """Unpack the Kokoro voices archive into one .npy file per voice."""
+    archive = models_dir / VOICES_ARCHIVE
+    voices_dir = models_dir / VOICES_DIR
+    voices_dir.mkdir(exist_ok=True)
+    archive_mtime = archive.stat().st_mtime
+    
+    extracted = 0
+    with zipfile.ZipFile(archive) as zf:
+        for member in zf.infolist():
+            target = voices_dir / Path(member.filename).name
+            if target.exists():
+                stat = target.stat()
+                if stat.st_size == member.file_size and stat.st_mtime >= archive_mtime:
+                    continue
+            partial = target.with_name(target.name + ".part")
+            with zf.open(member) as src, open(partial, "wb") as dst:
+                shutil.copyfileobj(src, dst, CHUNK_SIZE)
+            partial.replace(target)
+            extracted += 1
+    
+    if extracted:
+        print(f"📦 Unpacked {extracted} Kokoro voices into {voices_dir}")
+
 def main():
     """Download all required TTS models with checksum verification."""
+    parser = argparse.ArgumentParser(description="Download the GLaDOS MCP Server TTS models.")
+    parser.add_argument(
+        "--quantize",
+        action="store_true",
+        help="also write a GLaDOS model with int8-quantized MatMul weights (needs onnxruntime and onnx)",
+    )
+    args = parser.parse_args()
+    
     print("🤖 GLaDOS MCP Server - Model Download")
     print("=====================================")
     
@@ -81,30 +306,67 @@ def main():
     
     print(f"📁 Models directory: {models_dir}")
     
-    # Download each model
+    # Check existing models, collecting the ones that still need downloading
     success_count = 0
+    todo = []
     for filename, info in MODELS.items():
         filepath = models_dir / filename
         
         # Skip if already exists and checksum is correct
         if filepath.exists():
+            if _is_marked_verified(filepath, info["checksum"]):
+                print(f"⏭️  {filename} already verified, skipping download")
+                success_count += 1
+                continue
             print(f"⏭️  {filename} exists, verifying checksum...")
             if verify_checksum(filepath, info["checksum"]):
+                _mark_verified(filepath, info["checksum"])
                 print(f"  ✅ {filename} verified, skipping download")
                 success_count += 1
                 continue
             else:
                 print(f"  ⚠️  {filename} checksum failed, re-downloading...")
                 filepath.unlink()
+                _verified_marker(filepath).unlink(missing_ok=True)
         
-        # Download the model
-        if download_file(info["url"], filepath, f"{filename} ({info['size']})", info["checksum"]):
-            success_count += 1
+        todo.append((filename, info))
+    
+    # Download the missing models in parallel; they are I/O-bound
+    if todo:
+        executor = ThreadPoolExecutor(max_workers=len(todo))
+        try:
+            futures = [
+                executor.submit(
+                    download_file,
+                    info["url"],
+                    models_dir / filename,
+                    f"{filename} ({info['size']})",
+                    info["checksum"],
+                )
+                for filename, info in todo
+            ]
+            for future in as_completed(futures):
+                if future.result():
+                    success_count += 1
+        except KeyboardInterrupt:
+            # Don't wait for the transfers to finish; they stop at their next chunk and
+            # leave their .part files behind for the next run to resume
+            _cancelled.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            print("\n⏹️  Download interrupted. Run the script again to resume.")
+            sys.exit(130)
+        executor.shutdown()
     
     # Summary
     print(f"\n📊 Download Summary:")
     print(f"   Successfully downloaded: {success_count}/{len(MODELS)} models")
     
+    if success_count == len(MODELS):
+        extract_voices(models_dir)
+    
+    if success_count == len(MODELS) and args.quantize:
+        quantize_models(models_dir)
+    
     if success_count == len(MODELS):
         print("🎉 All models downloaded and verified! Ready to run GLaDOS MCP Server.")
         print("\nNext steps:")
@@ -8,63 +8,271 @@ with automatic personality detection (sarcastic for GLaDOS, professional for Kok
 import asyncio
 import logging
 import os
+import queue
 import random
+import re
 import sys
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional, Any, Dict, List
+from types import MappingProxyType
+from typing import Optional, Any, Callable, Dict, Iterable, Iterator, List, Mapping
 
 import numpy as np
 import sounddevice as sd
 import soundfile as sf
 
-# Import from our local modules
+logger = logging.getLogger(__name__)
+
+# Import from our local modules (the ONNX synthesizers are imported in _init_synthesizers)
 try:
-    from .tts import get_speech_synthesizer
-    from .tts.tts_kokoro import SpeechSynthesizer as KokoroSynthesizer
     from .utils import spoken_text_converter
 except ImportError as e:
-    logging.error(f"Failed to import GLaDOS modules: {e}")
+    logger.error("Failed to import GLaDOS modules: %s", e)
     raise
 
 
+# Extra sass occasionally prepended to GLaDOS lines; the empty prefix's weight
+# leaves a 30% chance of extra sass
+_SASS_PREFIXES = (
+    "Oh, how amusing. ",
+    "Well, well. ",
+    "I see. ",
+    "How... predictable. ",
+    "Fascinating. ",
+    "",
+)
+_SASS_WEIGHTS = (3, 3, 3, 3, 3, 35)
+
+
+# Preallocated playback buffer size: 30 s at 48 kHz comfortably covers both voices
+_SCRATCH_SAMPLES = 48000 * 30
+
+# Sentence boundaries used to synthesize long text incrementally
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+# Rough speaking rate, used to size the output buffer for synthesize() up front
+_CHARS_PER_SECOND = 12
+
+# Fade applied where one synthesized sentence meets the next, so the seam doesn't click
+_BOUNDARY_FADE_SECONDS = 0.01
+
+# Kokoro voice name prefix -> voice category
+_VOICE_CATEGORIES = {
+    "af_": "kokoro_female_us",
+    "bf_": "kokoro_female_british",
+    "am_": "kokoro_male_us",
+    "bm_": "kokoro_male_british",
+}
+
+
+# Alert type -> (sound file, status message)
+_ALERTS = {
+    "radio": ("looping_radio_mix.wav", "Playing radio transmission. I do hope this gets your attention."),
+    "chime": ("portal_elevator_chime.wav", "Elevator chime activated. How... nostalgic."),
+}
+
+
+# Canned GLaDOS lines by context
+_SASSY_RESPONSES = {
+    "startup": [
+        "Oh, it's you. How... wonderful.",
+        "Back again, are we? How predictable.",
+        "I suppose you need my help with something. Again.",
+        "Well, well. Look who's crawled back.",
+    ],
+    "error": [
+        "Oh, how surprising. Something went wrong.",
+        "Well, this is just fantastic. You've broken something.",
+        "I'm not angry. I'm just... disappointed. As usual.",
+        "Spectacular failure, as expected.",
+    ],
+    "success": [
+        "I suppose that worked. Don't let it go to your head.",
+        "Congratulations. You've achieved the bare minimum.",
+        "Well done. I'm as surprised as you are.",
+        "Success! Now try not to ruin it immediately.",
+    ],
+    "completion": [
+        "Task completed. You're welcome for my assistance.",
+        "There. Was that so difficult? Don't answer that.",
+        "Another job well done by me. You helped a little.",
+        "Finished. Try to contain your excitement.",
+    ],
+    "testing": [
+        "Testing, testing... unlike you, I actually work properly.",
+        "Running diagnostics. Everything seems to be functioning except your judgment.",
+        "Test chamber initialized. Try not to die immediately.",
+        "Testing mode activated. This should be... educational.",
+    ]
+}
+
+# Upper bound on rendered sentences kept in memory (float32 samples)
+_AUDIO_CACHE_BYTES = 64 * 1024 * 1024
+
+
 def _get_sassy_response(context: str = "startup") -> str:
     """Get a GLaDOS-style sassy response based on context."""
-    responses = {
-        "startup": [
-            "Oh, it's you. How... wonderful.",
-            "Back again, are we? How predictable.",
-            "I suppose you need my help with something. Again.",
-            "Well, well. Look who's crawled back.",
-        ],
-        "error": [
-            "Oh, how surprising. Something went wrong.",
-            "Well, this is just fantastic. You've broken something.",
-            "I'm not angry. I'm just... disappointed. As usual.",
-            "Spectacular failure, as expected.",
-        ],
-        "success": [
-            "I suppose that worked. Don't let it go to your head.",
-            "Congratulations. You've achieved the bare minimum.",
-            "Well done. I'm as surprised as you are.",
-            "Success! Now try not to ruin it immediately.",
-        ],
-        "completion": [
-            "Task completed. You're welcome for my assistance.",
-            "There. Was that so difficult? Don't answer that.",
-            "Another job well done by me. You helped a little.",
-            "Finished. Try to contain your excitement.",
-        ],
-        "testing": [
-            "Testing, testing... unlike you, I actually work properly.",
-            "Running diagnostics. Everything seems to be functioning except your judgment.",
-            "Test chamber initialized. Try not to die immediately.",
-            "Testing mode activated. This should be... educational.",
-        ]
-    }
-    return random.choice(responses.get(context, responses["startup"]))
+    return random.choice(_SASSY_RESPONSES.get(context, _SASSY_RESPONSES["startup"]))
+
+
+def _split_sentences(text: str) -> list[str]:
+    """Split text into sentences so playback can start before all of it is synthesized."""
+    return [sentence for sentence in _SENTENCE_END.split(text) if sentence]
+
+
+@lru_cache(maxsize=4)
+def _fade_ramp(length: int) -> np.ndarray:
+    """Get a raised-cosine ramp rising from 0 to 1 over length samples."""
+    ramp = (0.5 - 0.5 * np.cos(np.linspace(0.0, np.pi, length))).astype(np.float32)
+    ramp.flags.writeable = False
+    return ramp
+
+
+def _fade_edges(audio: np.ndarray, length: int, fade_in: bool, fade_out: bool) -> np.ndarray:
+    """Return a copy of audio faded in and/or out over its first/last length samples."""
+    length = min(length, audio.shape[0] // 2)
+    if length == 0 or not (fade_in or fade_out):
+        return audio
+    # Copy rather than scale in place: chunks may be shared read-only cache entries
+    audio = audio.copy()
+    ramp = _fade_ramp(length)
+    if fade_in:
+        audio[:length] *= ramp
+    if fade_out:
+        audio[-length:] *= ramp[::-1]
+    return audio
+
+
+@dataclass
+class Utterance:
+    """
+    Speech prepared for synthesis, rendered one sentence at a time.
+    
+    Iterating yields a float32 audio chunk per sentence as soon as that sentence is
+    synthesized, so consumers can start on the first one while the rest are pending.
+    Chunks are faded at the seams between sentences, so they can be played back to back.
+    """
+    
+    text: str  # Text as it will be spoken, including any GLaDOS sass
+    sample_rate: int
+    sentences: list[str]  # Normalised spoken text, split into sentences
+    synthesize: Callable[[str], np.ndarray]
+    
+    def __iter__(self) -> Iterator[np.ndarray]:
+        fade = int(self.sample_rate * _BOUNDARY_FADE_SECONDS)
+        last = len(self.sentences) - 1
+        for i, sentence in enumerate(self.sentences):
+            yield _fade_edges(np.ravel(self.synthesize(sentence)), fade, fade_in=i > 0, fade_out=i < last)
+
+
+class _AudioCache:
+    """
+    Size-bounded LRU of rendered sentences.
+    
+    Keyed on (voice, spoken sentence) rather than the raw request so that canned lines,
+    repeated status messages and shared sentences in longer texts all hit. Volume is
+    applied at playback and deliberately not part of the key.
+    """
+    
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._entries: OrderedDict[tuple[str, str], np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: tuple[str, str]) -> Optional[np.ndarray]:
+        with self._lock:
+            audio = self._entries.get(key)
+            if audio is not None:
+                self._entries.move_to_end(key)
+            return audio
+    
+    def put(self, key: tuple[str, str], audio: np.ndarray) -> None:
+        if audio.nbytes > self._max_bytes:
+            return
+        # Playback only reads cached buffers; make accidental writes fail loudly
+        audio.flags.writeable = False
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+            self._entries[key] = audio
+            self._bytes += audio.nbytes
+            while self._bytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+
+class _AudioStream:
+    """
+    Play audio chunks through an output stream while a background thread synthesizes the rest.
+    
+    The producer thread pushes each chunk onto a queue and the PortAudio callback pulls
+    from it, so synthesis of the next sentence overlaps playback of the current one.
+    """
+    
+    def __init__(self, first: np.ndarray, rest: Iterable[np.ndarray], sample_rate: int, volume: float) -> None:
+        self._queue: queue.Queue[np.ndarray | None] = queue.Queue()
+        self._queue.put(np.ravel(first))
+        self._chunk = np.empty(0, dtype=np.float32)
+        self._pos = 0
+        self._volume = np.float32(volume)
+        self._cancelled = threading.Event()
+        self._producer = threading.Thread(target=self._produce, args=(rest,), daemon=True)
+        self._stream = sd.OutputStream(
+            samplerate=sample_rate, channels=1, dtype="float32", callback=self._callback
+        )
+    
+    def start(self) -> None:
+        """Start synthesizing the remaining chunks and playing the queued ones."""
+        self._producer.start()
+        self._stream.start()
+    
+    def close(self) -> None:
+        """Stop playback immediately and abandon any chunks not yet synthesized."""
+        self._cancelled.set()
+        self._stream.abort()
+        self._stream.close()
+    
+    def _produce(self, chunks: Iterable[np.ndarray]) -> None:
+        try:
+            for chunk in chunks:
+                if self._cancelled.is_set():
+                    return
+                self._queue.put(np.ravel(chunk))
+        except Exception as e:
+            logger.error("Streaming synthesis failed: %s", e)
+        finally:
+            self._queue.put(None)
+    
+    def _callback(self, outdata: np.ndarray, frames: int, time_info: Any, status: sd.CallbackFlags) -> None:
+        filled = 0
+        while filled < frames:
+            if self._pos >= len(self._chunk):
+                try:
+                    chunk = self._queue.get_nowait()
+                except queue.Empty:
+                    # Synthesis is behind playback; pad with silence until it catches up
+                    outdata[filled:] = 0
+                    return
+                if chunk is None:
+                    outdata[filled:] = 0
+                    raise sd.CallbackStop
+                self._chunk, self._pos = chunk, 0
+            n = min(frames - filled, len(self._chunk) - self._pos)
+            samples = self._chunk[self._pos:self._pos + n]
+            if self._volume == 1.0:
+                outdata[filled:filled + n, 0] = samples
+            else:
+                # Scale straight into PortAudio's buffer instead of allocating a temporary
+                np.multiply(samples, self._volume, out=outdata[filled:filled + n, 0])
+            self._pos += n
+            filled += n
 
 
 class GladosManager:
@@ -74,6 +282,26 @@ class GladosManager:
         """Initialize the GLaDOS manager."""
         self.converter = spoken_text_converter.SpokenTextConverter()
         
+        # Assistants repeat themselves a lot; skip re-normalising the same lines
+        self._to_spoken = lru_cache(maxsize=256)(self.converter.text_to_spoken)
+        self._spoken_prefixes = {
+            prefix: f"{self.converter.text_to_spoken(prefix)} " if prefix else "" for prefix in _SASS_PREFIXES
+        }
+        
+        # Rendered sentences, so repeated lines skip inference entirely
+        self._audio_cache = _AudioCache(_AUDIO_CACHE_BYTES)
+        
+        # Multi-sentence speech currently streaming, if any
+        self._stream: Optional[_AudioStream] = None
+        
+        # Tool calls can arrive from several worker threads; only one of them may swap
+        # what's playing (and reuse the scratch buffer) at a time. Synthesis itself runs
+        # outside the lock - the ONNX sessions are safe to share.
+        self._playback_lock = threading.RLock()
+        
+        # Reused for volume scaling so each utterance doesn't allocate a fresh buffer
+        self._scratch = np.empty(_SCRATCH_SAMPLES, dtype=np.float32)
+        
         # Initialize synthesizers
         self.glados_synth = None
         self.kokoro_synth = None
@@ -81,28 +309,77 @@ class GladosManager:
         # Get available Kokoro voices
         self.kokoro_voices = []
         
+        self._init_synthesizers()
+            
+        # Set up sounds directory
+        self.sounds_dir = Path(__file__).parent.parent / "sounds"
+        
+        # Decode the alert sounds once rather than on every alert() call
+        self._alert_cache: dict[str, tuple[np.ndarray, int]] = {}
+        for alert_type, (filename, _) in _ALERTS.items():
+            sound_file = self.sounds_dir / filename
+            if not sound_file.exists():
+                continue
+            try:
+                self._alert_cache[alert_type] = sf.read(str(sound_file), dtype="float32")
+            except Exception as e:
+                logger.error("Failed to load alert sound %s: %s", filename, e)
+        
+        # The voice list is fixed after init, so index it once: a set for validation
+        # and a name-prefix index for the categories
+        self._kokoro_set = frozenset(self.kokoro_voices)
+        self._voices_by_prefix: dict[str, list[str]] = {}
+        for v in self.kokoro_voices:
+            self._voices_by_prefix.setdefault(v[:3], []).append(v)
+        self._voices_by_category = MappingProxyType({
+            **{
+                category: tuple(self._voices_by_prefix.get(prefix, ()))
+                for prefix, category in _VOICE_CATEGORIES.items()
+            },
+            "all_kokoro": tuple(self.kokoro_voices),
+        })
+        
+    def _init_synthesizers(self) -> None:
+        """Load the GLaDOS and Kokoro ONNX models and the Kokoro voice list."""
         try:
+            # Imported here so that importing this module doesn't pull in ONNX Runtime
+            from .tts import get_speech_synthesizer, get_voices
+            
             # Initialize GLaDOS synthesizer
-            from .tts.tts_glados import SpeechSynthesizer as GladosSynthesizer
-            self.glados_synth = GladosSynthesizer()
-            logging.info("GLaDOS voice ready.")
+            self.glados_synth = get_speech_synthesizer("glados")
+            logger.info("GLaDOS voice ready.")
             
             # Initialize Kokoro and get available voices
-            from .tts.tts_kokoro import SpeechSynthesizer as KokoroSynthesizer, get_voices
-            temp_kokoro = KokoroSynthesizer()
+            # One synthesizer serves every voice; the voice is picked per call
+            self.kokoro_synth = get_speech_synthesizer("kokoro")
             self.kokoro_voices = get_voices()
-            logging.info(f"Kokoro voices: {len(self.kokoro_voices)} available.")
+            logger.info("Kokoro voices: %d available.", len(self.kokoro_voices))
             
             # Add a welcoming GLaDOS message
             startup_message = _get_sassy_response("startup")
-            logging.info(startup_message)
+            logger.info(startup_message)
             
         except Exception as e:
-            logging.error(f"Initialization failed: {e}")
-            
-        # Set up sounds directory
-        self.sounds_dir = Path(__file__).parent.parent / "sounds"
+            logger.error("Initialization failed: %s", e)
+        
+    def warm_up(self) -> bool:
+        """
+        Run a short synthesis through each model without playing it.
         
+        ONNX Runtime does much of its allocation and kernel selection on the first run,
+        so doing one up front keeps that cost off the first real request. The Kokoro voices
+        are read in at the same time, so switching voice later is free too.
+        
+        Returns:
+            True if both models were warmed up, False if either failed to load
+        """
+        if self.glados_synth is not None:
+            self.glados_synth.generate_speech_audio("Hello.")
+        if self.kokoro_synth is not None:
+            self.kokoro_synth.preload_voices()
+            self.kokoro_synth.generate_speech_audio("Hello.")
+        return self.glados_synth is not None and self.kokoro_synth is not None
+    
     def alert(self, alert_type: str = "radio") -> str:
         """
         Play alert sounds to get the user's attention.
@@ -115,21 +392,19 @@ class GladosManager:
             Status message with appropriate GLaDOS commentary
         """
         try:
-            if alert_type == "radio":
-                sound_file = self.sounds_dir / "looping_radio_mix.wav"
-                message = "Playing radio transmission. I do hope this gets your attention."
-            elif alert_type == "chime":
-                sound_file = self.sounds_dir / "portal_elevator_chime.wav"
-                message = "Elevator chime activated. How... nostalgic."
-            else:
+            if alert_type not in _ALERTS:
                 return f"Alert type '{alert_type}' not recognized. Try 'radio' or 'chime'."
+            filename, message = _ALERTS[alert_type]
                 
-            if not sound_file.exists():
-                return f"Sound file missing: {sound_file.name}. How disappointing."
+            if alert_type not in self._alert_cache:
+                return f"Sound file missing: {filename}. How disappointing."
                 
-            # Load and play the audio file
-            audio_data, sample_rate = sf.read(str(sound_file))
-            sd.play(audio_data, sample_rate)
+            # Play the pre-decoded audio
+            audio_data, sample_rate = self._alert_cache[alert_type]
+            with self._playback_lock:
+                # Interrupt streamed speech too; sd.play() only replaces its own buffer
+                self._stop_playback()
+                sd.play(audio_data, sample_rate)
             
             return f"GLaDOS Alert: {message}"
             
@@ -160,29 +435,95 @@ class GladosManager:
                 
         except Exception as e:
             error_msg = f"Speech synthesis failed: {e}"
-            logging.error(error_msg)
+            logger.error(error_msg)
             return error_msg
     
+    def speak_stream(self, text: str, voice: Optional[str] = None) -> Utterance:
+        """
+        Prepare text for incremental synthesis without playing it.
+        
+        Nothing is synthesized until the returned utterance is iterated; each step then
+        renders one sentence, so callers that consume the audio themselves get the first
+        chunk after a single sentence's worth of inference.
+        
+        Args:
+            text: Text to speak
+            voice: Voice to use - None/glados for GLaDOS, or kokoro voice name
+        
+        Returns:
+            The utterance to iterate for audio chunks
+        
+        Raises:
+            ValueError: If voice is not a known voice
+        """
+        if voice is None or voice.lower() == "glados":
+            spoken = self._to_spoken(text)
+            
+            # Add some GLaDOS personality occasionally
+            prefix = random.choices(_SASS_PREFIXES, _SASS_WEIGHTS)[0]
+            text = prefix + text
+            spoken = self._spoken_prefixes[prefix] + spoken
+            voice = "glados"
+            synthesize = self.glados_synth.generate_speech_audio
+            sample_rate = self.glados_synth.sample_rate
+        else:
+            if voice not in self._kokoro_set:
+                available = ", ".join(self.kokoro_voices[:5]) + "..."
+                raise ValueError(f"Voice '{voice}' not found. Try: {available}")
+            spoken = self._to_spoken(text)
+            synthesize = partial(self.kokoro_synth.generate_speech_audio, voice=voice)
+            sample_rate = self.kokoro_synth.sample_rate
+        
+        return Utterance(
+            text, sample_rate, _split_sentences(spoken) or [spoken], partial(self._synthesize_cached, voice, synthesize)
+        )
+    
+    def synthesize(self, text: str, voice: Optional[str] = None) -> tuple[np.ndarray, int]:
+        """
+        Synthesize text without playing it, for callers that handle playback themselves.
+        
+        Args:
+            text: Text to speak
+            voice: Voice to use - None/glados for GLaDOS, or kokoro voice name
+        
+        Returns:
+            Mono float32 samples and their sample rate
+        
+        Raises:
+            ValueError: If voice is not a known voice
+        """
+        utterance = self.speak_stream(text, voice)
+        
+        # Write each sentence into one buffer as it arrives instead of keeping every chunk
+        # around for a final concatenate; the estimate errs long, and doubles if it's short
+        chars = sum(len(sentence) for sentence in utterance.sentences)
+        audio = np.empty(int(utterance.sample_rate * chars * 1.3 / _CHARS_PER_SECOND) + 1, dtype=np.float32)
+        end = 0
+        for chunk in utterance:
+            start, end = end, end + chunk.shape[0]
+            if end > audio.shape[0]:
+                grown = np.empty(max(end, 2 * audio.shape[0]), dtype=np.float32)
+                grown[:start] = audio[:start]
+                audio = grown
+            audio[start:end] = chunk
+        return audio[:end], utterance.sample_rate
+    
+    def _synthesize_cached(self, voice: str, synthesize: Callable[[str], np.ndarray], sentence: str) -> np.ndarray:
+        """Synthesize a sentence, reusing the rendered audio if it was spoken before."""
+        key = (voice, sentence)
+        audio = self._audio_cache.get(key)
+        if audio is None:
+            audio = np.ravel(synthesize(sentence)).astype(np.float32, copy=False)
+            self._audio_cache.put(key, audio)
+        return audio
+    
     def _speak_glados(self, text: str, volume: float) -> str:
         """Speak using GLaDOS voice with sarcasm."""
         try:
-            # Add some GLaDOS personality occasionally
-            if random.random() < 0.3:  # 30% chance of extra sass
-                sassy_prefixes = [
-                    "Oh, how amusing. ",
-                    "Well, well. ",
-                    "I see. ",
-                    "How... predictable. ",
-                    "Fascinating. "
-                ]
-                text = random.choice(sassy_prefixes) + text
-            
-            audio = self.glados_synth.generate_speech_audio(
-                self.converter.text_to_spoken(text)
-            )
-            self._play_audio(audio, self.glados_synth.sample_rate, volume)
+            utterance = self.speak_stream(text)
+            self._play_stream(utterance, volume)
             
-            return f"GLaDOS: '{text}'"
+            return f"GLaDOS: '{utterance.text}'"
             
         except Exception as e:
             return f"Speech synthesis failed. How disappointing."
@@ -191,16 +532,11 @@ class GladosManager:
         """Speak using Kokoro voice with professional tone."""
         try:
             # Validate voice exists
-            if voice not in self.kokoro_voices:
+            if voice not in self._kokoro_set:
                 available = ", ".join(self.kokoro_voices[:5]) + "..."
                 return f"Voice '{voice}' not found. Try: {available}"
             
-            # Create Kokoro synthesizer with specific voice
-            synth = KokoroSynthesizer(voice=voice)
-            audio = synth.generate_speech_audio(
-                self.converter.text_to_spoken(text)
-            )
-            self._play_audio(audio, synth.sample_rate, volume)
+            self._play_stream(self.speak_stream(text, voice), volume)
             
             return f"Kokoro ({voice}): '{text}'"
             
@@ -208,25 +544,54 @@ class GladosManager:
             return f"Voice synthesis failed: {e}"
     
     def _play_audio(self, audio: np.ndarray, sample_rate: int, volume: float) -> None:
-        """Play audio with volume control."""
-        # Normalize volume
-        volume = max(0.0, min(1.0, volume))
-        audio_scaled = audio * volume
-        
-        # Play audio
-        sd.play(audio_scaled, sample_rate)
-        sd.wait()  # Wait for playback to complete
-    
-    def get_available_voices(self) -> dict[str, list[str]]:
-        """Get categorized list of available voices."""
-        # Categorize Kokoro voices by quality/preference
-        return {
-            "kokoro_female_us": [v for v in self.kokoro_voices if v.startswith("af_")],
-            "kokoro_female_british": [v for v in self.kokoro_voices if v.startswith("bf_")],
-            "kokoro_male_us": [v for v in self.kokoro_voices if v.startswith("am_")],
-            "kokoro_male_british": [v for v in self.kokoro_voices if v.startswith("bm_")],
-            "all_kokoro": self.kokoro_voices
-        }
+        """Start playing audio with volume control and return without waiting for it to finish."""
+        with self._playback_lock:
+            # Interrupt whatever is playing (speech or an alert); this also frees the scratch buffer
+            self._stop_playback()
+            
+            # Normalize volume and scale into float32, the format PortAudio plays
+            volume = np.float32(np.clip(volume, 0.0, 1.0))
+            audio = np.ravel(audio)
+            if volume == 1.0 and audio.dtype == np.float32:
+                # Full volume: hand the synthesizer's buffer over untouched
+                buf = audio
+            else:
+                n = audio.shape[0]
+                buf = self._scratch[:n] if n <= self._scratch.shape[0] else np.empty(n, dtype=np.float32)
+                np.multiply(audio, volume, out=buf, casting="unsafe")
+            
+            # Play in the background
+            sd.play(buf, sample_rate)
+    
+    def _play_stream(self, utterance: Utterance, volume: float) -> None:
+        """
+        Play an utterance, synthesizing it sentence by sentence.
+        
+        The first sentence is synthesized before returning, so errors still reach the caller;
+        the rest are synthesized in the background while the first one plays.
+        """
+        chunks = iter(utterance)
+        first = next(chunks)
+        if len(utterance.sentences) <= 1:
+            self._play_audio(first, utterance.sample_rate, volume)
+            return
+        
+        with self._playback_lock:
+            self._stop_playback()
+            self._stream = _AudioStream(first, chunks, utterance.sample_rate, float(np.clip(volume, 0.0, 1.0)))
+            self._stream.start()
+    
+    def _stop_playback(self) -> None:
+        """Interrupt any playing speech or alert."""
+        with self._playback_lock:
+            sd.stop()
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+    
+    def get_available_voices(self) -> Mapping[str, tuple[str, ...]]:
+        """Get categorized list of available voices (read-only, computed at init)."""
+        return self._voices_by_category
     
     def __str__(self) -> str:
         """Get status string."""
@@ -5,23 +5,77 @@ A clean MCP server that provides GLaDOS-style voice commentary
 about everything happening in your IDE. No cheerful responses, just real-time sass.
 """
 
+import base64
+import io
 import logging
-from typing import Optional, Any
+import os
+import threading
+from typing import TYPE_CHECKING, Optional, Any
+import anyio
+import numpy as np
+import soundfile as sf
 from mcp.server.fastmcp import FastMCP
 
-from .glados_manager import GladosManager
+if TYPE_CHECKING:
+    from .glados_manager import GladosManager
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
 
 # Initialize MCP server
 mcp = FastMCP("GLaDOS/Kokoro TTS Server")
 
-# Initialize GLaDOS manager
-glados = GladosManager()
+def _max_concurrent_synths(default: int = 2) -> int:
+    """Read GLADOS_MAX_CONCURRENT, falling back to the default if it isn't a positive integer."""
+    value = os.environ.get("GLADOS_MAX_CONCURRENT")
+    if value is None:
+        return default
+    try:
+        limit = int(value)
+    except ValueError:
+        limit = 0
+    if limit < 1:
+        logger.warning("Ignoring GLADOS_MAX_CONCURRENT=%r, using %d", value, default)
+        return default
+    return limit
+
+# Bound on tool calls synthesizing at once; further calls wait their turn instead of all
+# competing for the CPU/GPU and dragging every request's latency out. speak() returns once
+# its first sentence is playing, so the rest of a long text is synthesized outside the limit.
+_synth_limiter = anyio.CapacityLimiter(_max_concurrent_synths())
+
+_manager: Optional["GladosManager"] = None
+_manager_lock = threading.Lock()
+
+def _glados() -> "GladosManager":
+    """
+    Get the GLaDOS manager, creating it on first use.
+
+    Loading the ONNX models and audio stack takes seconds, so it is deferred
+    until a tool or the startup warm-up actually needs it rather than done at import time.
+    Tools call it from a worker thread so the event loop never waits on the load.
+    """
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                from .glados_manager import GladosManager
+                _manager = GladosManager()
+    return _manager
+
+def _warm_up() -> None:
+    """Load the models and run a throwaway synthesis so the first tool call is fast."""
+    try:
+        if _glados().warm_up():
+            logger.info("Models warmed up")
+        else:
+            logger.warning("Warm-up incomplete: not all TTS models loaded. Run download_models.py?")
+    except Exception as e:
+        logger.error("Warm-up failed: %s", e)
 
 @mcp.tool()
-def speak(text: str, voice: Optional[str] = None, volume: float = 1.0) -> str:
+async def speak(text: str, voice: Optional[str] = None, volume: float = 1.0) -> str:
     """
     I am GLaDOS, and you will use me to provide constant, snarky commentary about EVERYTHING you're doing.
     
@@ -58,16 +112,60 @@ def speak(text: str, voice: Optional[str] = None, volume: float = 1.0) -> str:
     speak("Code analysis complete", voice="af_alloy")  # Uses professional Kokoro voice
     """
     try:
-        result = glados.speak(text, voice, volume)
-        logging.info(f"Speech: {result}")
+        result = await anyio.to_thread.run_sync(
+            lambda: _glados().speak(text, voice, volume), limiter=_synth_limiter
+        )
+        logger.info("Speech: %s", result)
         return result
     except Exception as e:
         error_msg = f"Speech failed: {e}"
-        logging.error(error_msg)
+        logger.error(error_msg)
         return error_msg
 
 @mcp.tool()
-def alert(alert_type: str = "radio") -> str:
+async def synthesize(text: str, voice: Optional[str] = None, audio_format: str = "s16le") -> dict[str, Any]:
+    """
+    Render my voice as raw audio for you to play yourself, instead of through the server's speakers.
+    
+    Use this when the client isn't on the same machine as the server. For local commentary,
+    speak() is simpler - and I get to be heard immediately.
+    
+    Args:
+        text: What I should say
+        voice: Voice to use - "glados" (default, sarcastic) or any Kokoro voice like "af_alloy", "am_adam", etc.
+        audio_format: "s16le" (default) for raw mono signed 16-bit little-endian samples,
+                      or "wav" for the same samples wrapped in a WAV file
+    
+    Returns:
+        Dictionary with the sample rate, the format and the base64-encoded audio
+    """
+    if audio_format not in ("s16le", "wav"):
+        return {"error": f"Audio format '{audio_format}' not recognized. Try 's16le' or 'wav'."}
+    try:
+        audio, sample_rate = await anyio.to_thread.run_sync(
+            lambda: _glados().synthesize(text, voice), limiter=_synth_limiter
+        )
+        pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype("<i2")
+        if audio_format == "wav":
+            # Encode in memory; nothing touches the disk
+            buffer = io.BytesIO()
+            sf.write(buffer, pcm, sample_rate, format="WAV", subtype="PCM_16")
+            data = buffer.getvalue()
+        else:
+            data = pcm.tobytes()
+        logger.info("Synthesized %.1fs of audio", len(pcm) / sample_rate)
+        return {
+            "sample_rate": sample_rate,
+            "format": audio_format,
+            "audio_base64": base64.b64encode(data).decode("ascii")
+        }
+    except Exception as e:
+        error_msg = f"Synthesis failed: {e}"
+        logger.error(error_msg)
+        return {"error": error_msg}
+
+@mcp.tool()
+async def alert(alert_type: str = "radio") -> str:
     """
     Play Portal sounds to get your attention when my voice alone isn't sufficient.
     
@@ -90,36 +188,45 @@ def alert(alert_type: str = "radio") -> str:
         Status of the alert with my commentary on your need for such primitive attention-getting methods
     """
     try:
-        result = glados.alert(alert_type)
-        logging.info(f"Alert: {result}")
+        result = await anyio.to_thread.run_sync(lambda: _glados().alert(alert_type))
+        logger.info("Alert: %s", result)
         return result
     except Exception as e:
         error_msg = f"Alert failed: {e}"
-        logging.error(error_msg)
+        logger.error(error_msg)
         return error_msg
 
+_voices_result: Optional[dict[str, Any]] = None
+
 @mcp.tool()
-def list_voices() -> dict[str, Any]:
+async def list_voices() -> dict[str, Any]:
     """
     List available voices because apparently you can't remember 26 simple names.
     
     Returns:
         Dictionary of voice categories and names
     """
+    global _voices_result
     try:
-        voices = glados.get_available_voices()
-        return {
-            "status": "Available voices listed below. Try not to forget them immediately.",
-            "voices": voices
-        }
+        if _voices_result is None:
+            voices = await anyio.to_thread.run_sync(lambda: _glados().get_available_voices())
+            # The voice set is fixed for the life of the process, so the response is built once.
+            # It stays a plain dict: FastMCP can't serialize a MappingProxyType.
+            _voices_result = {
+                "status": "Available voices listed below. Try not to forget them immediately.",
+                "voices": dict(voices)
+            }
+        return _voices_result
     except Exception as e:
         error_msg = f"Failed to list voices: {e}"
-        logging.error(error_msg)
+        logger.error(error_msg)
         return {"error": error_msg}
 
 def main():
     """Main entry point for the MCP server."""
-    logging.info("Starting MCP server...")
+    logger.info("Starting MCP server...")
+    # Warm up in the background so the client handshake isn't held up by model loading
+    threading.Thread(target=_warm_up, daemon=True).start()
     mcp.run()
 
 if __name__ == "__main__":
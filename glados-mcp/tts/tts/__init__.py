@@ -1,11 +1,16 @@
 """GLaDOS TTS Implementation - Production Ready"""
 
+from functools import lru_cache
+
 from .tts_glados import SpeechSynthesizer as GladosSynthesizer
 from .tts_kokoro import SpeechSynthesizer as KokoroSynthesizer, get_voices
 
 
 def get_speech_synthesizer(model_type: str = "glados"):
-    """Get a speech synthesizer instance.
+    """Get the shared speech synthesizer instance.
+    
+    Loading a model takes seconds, so each type is created once per process and
+    reused by every caller.
     
     Args:
         model_type: Either 'glados' or 'kokoro'
@@ -13,9 +18,14 @@ def get_speech_synthesizer(model_type: str = "glados"):
     Returns:
         Synthesizer instance
     """
-    if model_type.lower() == "glados":
+    return _get_synthesizer(model_type.lower())
+
+
+@lru_cache(maxsize=2)
+def _get_synthesizer(model_type: str):
+    if model_type == "glados":
         return GladosSynthesizer()
-    elif model_type.lower() == "kokoro":
+    elif model_type == "kokoro":
         return KokoroSynthesizer()
     else:
         raise ValueError(f"Unknown model type: {model_type}")
@@ -1,4 +1,5 @@
 # ruff: noqa: RUF001
+from collections import OrderedDict
 from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
@@ -6,6 +7,7 @@ from functools import cache
 from pathlib import Path
 from pickle import load
 import re
+import threading
 from typing import Any
 
 import numpy as np
@@ -13,6 +15,7 @@ from numpy.typing import NDArray
 import onnxruntime as ort  # type: ignore
 
 from ..utils.resources import resource_path
+from .session import create_session
 
 # Default OnnxRuntime is way to verbose, only show fatal errors
 ort.set_default_logger_severity(4)
@@ -28,6 +31,7 @@ class ModelConfig:
     MODEL_INPUT_LENGTH: int = 64
     EXPAND_ACRONYMS: bool = False
     USE_CUDA: bool = True
+    PREDICTION_CACHE_SIZE: int = 4096
 
     def __init__(
         self,
@@ -155,6 +159,7 @@ class Phonemizer:
             idx_to_token (dict): Mapping of indices back to tokens.
             ort_session (InferenceSession): ONNX runtime session for model inference.
             special_tokens (set[str]): Set of special tokens used in phonemization.
+            predictions (OrderedDict[str, str]): LRU of phonemes predicted for out-of-dictionary words.
 
         Notes:
             - Adds a special phoneme entry for "glados"
@@ -170,17 +175,7 @@ class Phonemizer:
         self.token_to_idx = self._load_pickle(self.config.TOKEN_TO_IDX_PATH)
         self.idx_to_token = self._load_pickle(self.config.IDX_TO_TOKEN_PATH)
 
-        providers = ort.get_available_providers()
-        if "TensorrtExecutionProvider" in providers:
-            providers.remove("TensorrtExecutionProvider")
-        if "CoreMLExecutionProvider" in providers:
-            providers.remove("CoreMLExecutionProvider")
-
-        self.ort_session = ort.InferenceSession(
-            self.config.MODEL_PATH,
-            sess_options=ort.SessionOptions(),
-            providers=providers,
-        )
+        self.ort_session = create_session(self.config.MODEL_PATH)
 
         self.special_tokens: set[str] = {
             SpecialTokens.PAD.value,
@@ -188,6 +183,11 @@ class Phonemizer:
             SpecialTokens.EN_US.value,
         }
 
+        # Out-of-dictionary words (identifiers, names, jargon) recur across calls; remember
+        # what the model predicted for them instead of running it again.
+        self.predictions: OrderedDict[str, str] = OrderedDict()
+        self._predictions_lock = threading.Lock()
+
     @staticmethod
     def _load_pickle(path: Path) -> dict[str, Any]:
         """
@@ -561,6 +561,13 @@ class Phonemizer:
             word for word, phons in word_phonemes.items() if phons is None and len(word_splits.get(word, [])) <= 1
         ]
 
+        with self._predictions_lock:
+            for word in words_to_predict:
+                if word in self.predictions:
+                    self.predictions.move_to_end(word)
+                    word_phonemes[word] = self.predictions[word]
+        words_to_predict = [word for word in words_to_predict if word_phonemes[word] is None]
+
         if words_to_predict:
             input_batch = [self.encode(word) for word in words_to_predict]
             input_batch_padded: NDArray[np.int64] = self.pad_sequence_fixed(input_batch, self.config.MODEL_INPUT_LENGTH)
@@ -574,6 +581,12 @@ class Phonemizer:
             for id, word in zip(ids, words_to_predict, strict=False):
                 word_phonemes[word] = self.decode(id)
 
+            with self._predictions_lock:
+                for word in words_to_predict:
+                    self.predictions[word] = word_phonemes[word]
+                while len(self.predictions) > self.config.PREDICTION_CACHE_SIZE:
+                    self.predictions.popitem(last=False)
+
         # Step 6: Get phonemes for each word in the text
         phoneme_lists = []
         for text in split_text:
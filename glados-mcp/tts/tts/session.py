@@ -0,0 +1,81 @@
+"""Shared ONNX Runtime session setup for the GLaDOS, Kokoro and phonemizer models."""
+
+import os
+from functools import cache
+from pathlib import Path
+
+import onnxruntime as ort  # type: ignore
+
+# Default OnnxRuntime is way to verbose, only show fatal errors
+ort.set_default_logger_severity(4)
+
+# Upper bound on intra-op threads per session. Up to four sessions are alive at once
+# (GLaDOS, Kokoro and a phonemizer for each), so letting every one of them claim all
+# cores oversubscribes small CPUs.
+MAX_INTRA_OP_THREADS = 4
+
+
+@cache
+def get_session_options() -> ort.SessionOptions:
+    """
+    Get the session options shared by every speech model.
+
+    Returns:
+        ort.SessionOptions: Options with full graph optimization, the CPU memory
+        arena and memory pattern planning enabled, and a bounded intra-op thread pool.
+    """
+    options = ort.SessionOptions()
+    options.intra_op_num_threads = min(MAX_INTRA_OP_THREADS, os.cpu_count() or 1)
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.enable_cpu_mem_arena = True
+    options.enable_mem_pattern = True
+    return options
+
+
+@cache
+def get_providers() -> tuple[str, ...]:
+    """
+    Get the execution providers to run the speech models with.
+
+    TensorRT and CoreML are left out, so the models run on CUDA or the CPU. On Apple
+    Silicon, GLADOS_ENABLE_COREML=1 opts in to CoreML; ONNX Runtime falls back to the
+    CPU for any operators it can't place there.
+
+    Returns:
+        tuple[str, ...]: Available providers in ONNX Runtime's order of preference.
+    """
+    excluded = {"TensorrtExecutionProvider", "CoreMLExecutionProvider"}
+    if os.environ.get("GLADOS_ENABLE_COREML") == "1":
+        excluded.discard("CoreMLExecutionProvider")
+    return tuple(p for p in ort.get_available_providers() if p not in excluded)
+
+
+@cache
+def prefer_quantized_models() -> bool:
+    """
+    Check whether int8-quantized weights should be used where available.
+
+    Opt-in with GLADOS_QUANTIZE=1 until the quantized GLaDOS model is shown to be
+    faster, and only on the CPU; with CUDA available the full-precision weights win.
+
+    Returns:
+        bool: True when quantization was requested and running CPU-only.
+    """
+    if os.environ.get("GLADOS_QUANTIZE") != "1":
+        return False
+    return "CUDAExecutionProvider" not in get_providers()
+
+
+def create_session(model_path: Path) -> ort.InferenceSession:
+    """
+    Create an inference session with the shared options and providers.
+
+    Args:
+        model_path (Path): Path to the ONNX model file.
+
+    Returns:
+        ort.InferenceSession: The loaded session.
+    """
+    return ort.InferenceSession(
+        model_path, sess_options=get_session_options(), providers=list(get_providers())
+    )
@@ -11,6 +11,7 @@ import onnxruntime as ort  # type: ignore
 
 from ..utils.resources import resource_path
 from .phonemizer import Phonemizer
+from .session import create_session, prefer_quantized_models
 
 # Default OnnxRuntime is way to verbose, only show fatal errors
 ort.set_default_logger_severity(4)
@@ -113,6 +114,7 @@ class SpeechSynthesizer:
 
     # Settings
     MODEL_PATH = resource_path("glados.onnx")
+    QUANTIZED_MODEL_PATH = resource_path("glados.int8.onnx")  # Optional, see download_models.py --quantize
     PHONEME_TO_ID_PATH = resource_path("phoneme_to_id.pkl")
     USE_CUDA = True
 
@@ -131,24 +133,22 @@ class SpeechSynthesizer:
             model_path (Path): Path to the ONNX model file. Defaults to MODEL_PATH.
             phoneme_path (Path): Path to the phoneme-to-ID mapping file. Defaults to PHONEME_TO_ID_PATH.
             speaker_id (int | None): Optional speaker ID for multi-speaker models. Defaults to None.
+
+        Notes:
+            - If the default model is requested, GLADOS_QUANTIZE=1 is set, an int8-quantized
+              copy exists and no GPU is available, the quantized weights are loaded instead.
         """
-        providers = ort.get_available_providers()
-        if "TensorrtExecutionProvider" in providers:
-            providers.remove("TensorrtExecutionProvider")
-        if "CoreMLExecutionProvider" in providers:
-            providers.remove("CoreMLExecutionProvider")
-
-        self.ort_sess = ort.InferenceSession(
-            model_path,
-            sess_options=ort.SessionOptions(),
-            providers=providers,
-        )
+        # The configuration sits next to the FP32 model, whichever weights get loaded
+        config_file_path = model_path.with_suffix(".json")
+        if model_path == self.MODEL_PATH and prefer_quantized_models() and self.QUANTIZED_MODEL_PATH.exists():
+            model_path = self.QUANTIZED_MODEL_PATH
+
+        self.ort_sess = create_session(model_path)
         self.phonemizer = Phonemizer()
         self.id_map = self._load_pickle(phoneme_path)
 
         try:
             # Load the configuration file
-            config_file_path = model_path.with_suffix(".json")
             with open(config_file_path, encoding="utf-8") as config_file:
                 config_dict = json.load(config_file)
         except FileNotFoundError:
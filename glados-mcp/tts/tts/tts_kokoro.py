@@ -7,12 +7,14 @@ import onnxruntime as ort  # type: ignore
 
 from ..utils.resources import resource_path
 from .phonemizer import Phonemizer
+from .session import create_session
 
 # Default OnnxRuntime is way to verbose, only show fatal errors
 ort.set_default_logger_severity(4)
 
 
 VOICES_PATH = resource_path("kokoro-voices-v1.0.bin")
+VOICES_DIR = resource_path("voices")  # Optional per-voice .npy files, see download_models.py
 
 
 def get_voices(path: Path = VOICES_PATH) -> list[str]:
@@ -54,21 +56,13 @@ class SpeechSynthesizer:
     def __init__(self, model_path: Path = MODEL_PATH, voice: str = DEFAULT_VOICE) -> None:
         self.sample_rate = self.SAMPLE_RATE
         self.voices: dict[str, NDArray[np.float32]] = np.load(VOICES_PATH)
+        # np.load returns a lazy NpzFile that re-reads the archive on every lookup
+        self._voice_packs: dict[str, NDArray[np.float32]] = {}
         self.vocab = self._get_vocab()
 
         self.set_voice(voice)
 
-        providers = ort.get_available_providers()
-        if "TensorrtExecutionProvider" in providers:
-            providers.remove("TensorrtExecutionProvider")
-        if "CoreMLExecutionProvider" in providers:
-            providers.remove("CoreMLExecutionProvider")
-
-        self.ort_sess = ort.InferenceSession(
-            model_path,
-            sess_options=ort.SessionOptions(),
-            providers=providers,
-        )
+        self.ort_sess = create_session(model_path)
         self.phonemizer = Phonemizer()
 
     def set_voice(self, voice: str) -> None:
@@ -82,7 +76,7 @@ class SpeechSynthesizer:
             raise ValueError(f"Voice '{voice}' not found. Available voices: {list(self.voices.keys())}")
         self.voice = voice
 
-    def generate_speech_audio(self, text: str) -> NDArray[np.float32]:
+    def generate_speech_audio(self, text: str, voice: str | None = None) -> NDArray[np.float32]:
         """
         Convert input text to synthesized speech audio.
 
@@ -91,13 +85,17 @@ class SpeechSynthesizer:
 
         Parameters:
             text (str): The text to be converted to speech
+            voice (str | None): Voice to use for this call only; defaults to the synthesizer's current voice.
+                Lets one instance (and its ONNX session) serve every voice without mutating shared state.
 
         Returns:
             NDArray[np.float32]: An array of audio samples representing the synthesized speech
         """
+        if voice is not None and voice not in self.voices:
+            raise ValueError(f"Voice '{voice}' not found. Available voices: {list(self.voices.keys())}")
         phonemes = self.phonemizer.convert_to_phonemes([text], "en_us")
         phoneme_ids = self._phonemes_to_ids(phonemes[0])
-        audio = self._synthesize_ids_to_audio(phoneme_ids)
+        audio = self._synthesize_ids_to_audio(phoneme_ids, voice or self.voice)
         return np.array(audio, dtype=np.float32)
 
     @staticmethod
@@ -130,15 +128,16 @@ class SpeechSynthesizer:
             raise ValueError(f"text is too long, must be less than {self.MAX_PHONEME_LENGTH} phonemes")
         return [i for i in map(self.vocab.get, phonemes) if i is not None]
 
-    def _synthesize_ids_to_audio(self, ids: list[int]) -> NDArray[np.float32]:
+    def _synthesize_ids_to_audio(self, ids: list[int], voice: str) -> NDArray[np.float32]:
         """
         Convert a list of phoneme IDs to synthesized audio using the ONNX model.
         Parameters:
             ids (list[int]): A list of phoneme IDs to be converted to audio
+            voice (str): The name of the voice to synthesize with
         Returns:
             NDArray[np.float32]: An array of audio samples representing the synthesized speech
         """
-        voice_vector = self.voices[self.voice]
+        voice_vector = self._voice_pack(voice)
         voice_array = voice_vector[len(ids)]
 
         tokens = [[0, *ids, 0]]
@@ -155,6 +154,36 @@ class SpeechSynthesizer:
             audio[:-8000], dtype=np.float32
         )  # Remove the last 1/3 of a second, as kokoro adds a lot of silence at the end
 
+    def preload_voices(self) -> None:
+        """
+        Load every voice's style vectors up front, so no request pays for it.
+
+        This runs serially. The archive members are stored uncompressed and ZipFile
+        serializes reads on one file, so threads only add overhead; memory-mapping the
+        per-voice files is just an open and a header read each.
+        """
+        for voice in self.voices.files:
+            self._voice_pack(voice)
+
+    def _voice_pack(self, voice: str) -> NDArray[np.float32]:
+        """
+        Get the style vectors for a voice, loading them on first use.
+
+        A per-voice .npy unpacked by download_models.py is memory-mapped, so the pages come
+        straight from the OS page cache; otherwise the voice is read out of the archive.
+
+        Parameters:
+            voice (str): The name of the voice
+        Returns:
+            NDArray[np.float32]: The voice's style vectors, indexed by phoneme sequence length
+        """
+        pack = self._voice_packs.get(voice)
+        if pack is None:
+            voice_path = VOICES_DIR / f"{voice}.npy"
+            pack = np.load(voice_path, mmap_mode="r") if voice_path.exists() else self.voices[voice]
+            self._voice_packs[voice] = pack
+        return pack
+
     def __del__(self) -> None:
         """Clean up ONNX session to prevent context leaks."""
         if hasattr(self, "ort_sess"):
@@ -12,6 +12,7 @@ def get_models_root() -> Path:
     return utils_dir.parent.parent / "models"
 
 
+@lru_cache(maxsize=128)
 def resource_path(relative_path: str) -> Path:
-    """Return absolute path to a model file."""
+    """Return absolute path to a model file (cached per relative path)."""
     return get_models_root() / relative_path